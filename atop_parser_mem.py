@@ -1,116 +1,279 @@
 import re
+import io
 import os
+import mmap
+import itertools
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import argparse
 from datetime import datetime
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from pathlib import Path
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# 预编译正则表达式
+# 以换行符开头的字面量模式可以走正则引擎的快速查找，在C层跳过所有无关行
+_LINE_RE = re.compile(rb"\n((?:ATOP|MEM |SWP )[^\n]*)")
+_LINE_PREFIXES = (b'ATOP', b'MEM ', b'SWP ')
+# 数值列，每条记录按此顺序收集；atop只输出3~4位有效数字，用float32足够，内存占用减半
+_VALUE_COLUMNS = ['mem_tot', 'mem_free', 'swp_tot', 'swp_free']
+# 图表中的曲线: (列名, 图例名称, 悬停提示标签)
+_SERIES = [
+    ('mem_tot', 'MEM Total (GB)', 'MEM Total'),
+    ('mem_free', 'MEM Free (GB)', 'MEM Free'),
+    ('swp_tot', 'SWAP Total (GB)', 'SWAP Total'),
+    ('swp_free', 'SWAP Free (GB)', 'SWAP Free'),
+]
+# PNG图表宽度只有一千多像素，超过该点数时先抽样再绘制
+_PLOT_MAX_POINTS = 4000
+# 流式模式下回读CSV绘图时每次读取的行数
+_CSV_CHUNK_ROWS = 200000
+
+def _iter_atop_lines(file_path):
+    """mmap映射整个文件，只产出ATOP/MEM/SWP开头的行"""
+    with open(file_path, 'rb') as file:
+        try:
+            buf = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 空文件无法映射
+            return
+        try:
+            # 第一行前面没有换行符，需要单独判断
+            end = buf.find(b'\n')
+            first = buf[:end] if end >= 0 else buf[:]
+            if first[:4] in _LINE_PREFIXES:
+                yield first
+            for m in _LINE_RE.finditer(buf):
+                yield m.group(1)
+        finally:
+            buf.close()
+
+@lru_cache(maxsize=4096)
+def _parse_ts(d, t):
+    """解析atop时间戳的日期和时间字段（如 2025/06/11、00:00:01），按固定位置切片代替strptime"""
+    return datetime(int(d[0:4]), int(d[5:7]), int(d[8:10]),
+                    int(t[0:2]), int(t[3:5]), int(t[6:8]))
+
+def _parse_header(line):
+    """从ATOP头部行中取出采样时间，格式不匹配时返回None"""
+    # 形如: ATOP - myhost        2025/06/11  00:00:01        --------------         10m0s elapsed
+    parts = line.split()
+    if len(parts) < 5 or parts[1] != b'-':
+        return None
+    d, t = parts[3], parts[4]
+    if (len(d) != 10 or d[4:5] != b'/' or d[7:8] != b'/'
+            or len(t) != 8 or t[2:3] != b':' or t[5:6] != b':'):
+        return None
+    try:
+        return _parse_ts(d, t)
+    except ValueError:
+        return None
+
+def _parse_tot_free(line):
+    """按空白切分MEM/SWP行，返回((tot, free), (tot单位, free单位))，格式不匹配时返回None"""
+    # 形如: MEM | tot   15.5G | free    2.3G | cache   8.1G | ...
+    parts = line.split()
+    if len(parts) < 7 or parts[2] != b'tot' or parts[5] != b'free':
+        return None
+    tot, free = parts[3], parts[6]
+    if tot[-1:] not in (b'G', b'M') or free[-1:] not in (b'G', b'M'):
+        return None
+    try:
+        return (float(tot[:-1]), float(free[:-1])), (tot[-1:], free[-1:])
+    except ValueError:
+        return None
 
 def parse_atop_log(file_path):
     """解析atop日志文件，提取内存和交换空间使用数据"""
-    data = []
+    # 数值和单位分开收集，单位换算在解析结束后用NumPy一次完成
+    ts_list, val_list, unit_list = [], [], []
     current_timestamp = None
+    # MEM行的数据需要等到紧随其后的SWP行才能组成一条记录
+    mem_fields = None
     
-    with open(file_path, 'r') as file:
-        for line in file:
-            # 匹配时间戳行
-            timestamp_match = re.match(r"ATOP - \w+\s+(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})", line)
-            if timestamp_match:
-                current_timestamp = datetime.strptime(timestamp_match.group(1), "%Y/%m/%d %H:%M:%S")
-                continue
-                
-            # 匹配MEM行
-            mem_match = re.match(r"MEM \| tot\s+([\d.]+)(G|M) \| free\s+([\d.]+)(G|M)", line)
-            if mem_match and current_timestamp:
-                mem_tot = float(mem_match.group(1))
-                if mem_match.group(2) == 'M':
-                    mem_tot /= 1024
-                mem_free = float(mem_match.group(3))
-                if mem_match.group(4) == 'M':
-                    mem_free /= 1024
-                    
-            # 匹配SWP行
-            swp_match = re.match(r"SWP \| tot\s+([\d.]+)(G|M) \| free\s+([\d.]+)(G|M)", line)
-            if swp_match and current_timestamp and 'mem_tot' in locals():
-                swp_tot = float(swp_match.group(1))
-                if swp_match.group(2) == 'M':
-                    swp_tot /= 1024
-                swp_free = float(swp_match.group(3))
-                if swp_match.group(4) == 'M':
-                    swp_free /= 1024
-                
-                # 添加到数据列表
-                data.append({
-                    'timestamp': current_timestamp,
-                    'mem_tot': mem_tot,
-                    'mem_free': mem_free,
-                    'swp_tot': swp_tot,
-                    'swp_free': swp_free
-                })
-                
-    return pd.DataFrame(data)
-
-def parse_atop_directory(directory_path):
-    """解析目录中的所有atop日志文件，并合并数据"""
-    all_data = []
-    directory = Path(directory_path)
+    # 逐行处理在Python层的开销最大，这里只遍历扫描出的ATOP/MEM/SWP行
+    for line in _iter_atop_lines(file_path):
+        head = line[:4]
+        if head == b'ATOP':
+            # 每个ATOP头部行开始一个新的采样，头部无法解析时丢弃整个采样
+            current_timestamp = _parse_header(line)
+            mem_fields = None
+        elif head == b'MEM ':
+            # 解析MEM行
+            if current_timestamp:
+                mem_fields = _parse_tot_free(line)
+        elif head == b'SWP ':
+            # 解析SWP行
+            swp_fields = _parse_tot_free(line)
+            if swp_fields and mem_fields is not None:
+                # 添加到数据列表，顺序与_VALUE_COLUMNS一致
+                ts_list.append(current_timestamp)
+                val_list.extend(mem_fields[0] + swp_fields[0])
+                unit_list.extend(mem_fields[1] + swp_fields[1])
+                # 每组MEM数据只与一条SWP数据配对
+                mem_fields = None
+            
+    # 向量化换算单位：M为单位的值除以1024转为GB
+    values = np.asarray(val_list, dtype=np.float32).reshape(-1, len(_VALUE_COLUMNS))
+    units = np.asarray(unit_list, dtype='S1').reshape(values.shape)
+    values = np.where(units == b'M', values / 1024.0, values)
     
+    data = pd.DataFrame(values, columns=_VALUE_COLUMNS)
+    data.insert(0, 'timestamp', pd.to_datetime(ts_list))
+    return data
+
+def list_atop_files(directory_path):
+    """列出目录中的所有文件，按文件名排序后返回路径列表"""
     # 检查目录是否存在
-    if not directory.is_dir():
+    if not os.path.isdir(directory_path):
         raise FileNotFoundError(f"目录 {directory_path} 不存在")
     
-    # 获取目录中的所有文件
-    files = list(directory.glob('*'))
+    # 获取目录中的所有文件，scandir返回的条目自带文件类型信息，无需逐个stat
+    with os.scandir(directory_path) as entries:
+        files = sorted(entry.path for entry in entries if entry.is_file())
     
     if not files:
         print(f"警告: 目录 {directory_path} 中没有找到文件")
+    return files
+
+def _collect_result(file_path, future):
+    """取出单个文件的解析结果并打印提示，出错或没有有效数据时返回None"""
+    file_name = os.path.basename(file_path)
+    try:
+        file_data = future.result()
+    except Exception as e:
+        print(f"解析文件 {file_name} 时出错: {str(e)}")
+        return None
+    if file_data.empty:
+        print(f"文件 {file_name} 中没有找到有效数据")
+        return None
+    print(f"成功解析文件: {file_name}, 找到 {len(file_data)} 条记录")
+    return file_data
+
+def parse_atop_directory(directory_path, max_workers=None):
+    """解析目录中的所有atop日志文件，并合并数据
+
+    各文件之间互不依赖，使用进程池并行解析；max_workers为None时使用CPU核数
+    """
+    all_data = []
+    files = list_atop_files(directory_path)
+    if not files:
         return pd.DataFrame()
     
-    # 解析每个文件
-    for file_path in files:
-        try:
-            # 尝试解析文件
-            file_data = parse_atop_log(file_path)
-            if not file_data.empty:
-                print(f"成功解析文件: {file_path.name}, 找到 {len(file_data)} 条记录")
+    # 并行解析每个文件，按提交顺序取回结果，保证合并顺序和提示信息的顺序固定
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(file_path, executor.submit(parse_atop_log, file_path)) for file_path in files]
+        for file_path, future in futures:
+            file_data = _collect_result(file_path, future)
+            if file_data is not None:
                 all_data.append(file_data)
-            else:
-                print(f"文件 {file_path.name} 中没有找到有效数据")
-        except Exception as e:
-            print(f"解析文件 {file_path.name} 时出错: {str(e)}")
     
     # 如果没有找到有效数据，返回空DataFrame
     if not all_data:
         return pd.DataFrame()
     
-    # 合并所有数据
+    # 合并所有数据（各文件结果已是float32，合并后无需再转换）
     merged_data = pd.concat(all_data, ignore_index=True)
     
-    # 按时间戳排序
-    merged_data = merged_data.sort_values('timestamp')
+    # 按时间戳原地排序，稳定排序保证同一时间戳的记录按文件名顺序及文件内顺序排列
+    merged_data.sort_values('timestamp', inplace=True, kind='mergesort')
     
     print(f"总共从 {len(all_data)} 个文件中解析出 {len(merged_data)} 条记录")
     return merged_data
 
-def generate_report(data, output_prefix='memory_report', generate_html=False):
-    """生成内存使用报告和图表"""
-    if data.empty:
-        print("没有找到有效数据")
-        return
+def _minmax_decimate(arrays, max_points=_PLOT_MAX_POINTS):
+    """按min/max分桶抽样，保留每个桶内各数值列的极值点，避免曲线中的尖峰丢失
+
+    arrays为列名到NumPy数组的字典，返回同样结构的抽样结果
+    """
+    n = len(arrays['timestamp'])
+    if n <= max_points:
+        return arrays
     
-    # 保存CSV文件
-    csv_file = f"{output_prefix}.csv"
-    data.to_csv(csv_file, index=False)
-    print(f"已保存CSV文件: {csv_file}")
+    # 每个桶为每列贡献最小值和最大值两个点，再加上首尾两点，总点数不超过max_points
+    n_buckets = max(1, (max_points - 2) // (2 * len(_VALUE_COLUMNS)))
+    stride = -(-n // n_buckets)
+    n_full = n - n % stride
+    offsets = np.arange(0, n_full, stride)
+    keep = [np.array([0, n - 1])]
+    for col in _VALUE_COLUMNS:
+        blocks = arrays[col][:n_full].reshape(-1, stride)
+        keep.append(offsets + blocks.argmin(axis=1))
+        keep.append(offsets + blocks.argmax(axis=1))
+        # 凑不满一个桶的尾部数据单独作为一个桶
+        tail = arrays[col][n_full:]
+        if tail.size:
+            keep.append(n_full + np.array([tail.argmin(), tail.argmax()]))
+    keep = np.unique(np.concatenate(keep))
+    return {col: arr[keep] for col, arr in arrays.items()}
+
+class _CsvWriter:
+    """向已打开的二进制文件逐块写出CSV，首次写入时写出不带引号的表头
+
+    优先使用PyArrow的CSVWriter，未安装PyArrow时回退到pandas.to_csv。
+    两者写出的数值相同，但文本格式略有差异：PyArrow写出的整数值浮点数不带".0"（如 3 而非 3.0）。
+    一次性写出和流式写出都经过这里，保证两种模式对同样的输入写出相同的内容
+    """
+    def __init__(self, file):
+        self.file = file
+        self._writer = None
+        self._header_written = False
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pv
+        except ImportError:
+            pa = pv = None
+        self._pa, self._pv = pa, pv
     
-    # 绘制内存使用图表（静态PNG）
+    def write(self, data):
+        if not self._header_written:
+            # 表头自行写出，PyArrow默认会给列名加引号
+            self.file.write((','.join(data.columns) + '\n').encode())
+            self._header_written = True
+        
+        if self._pa is None:
+            # pandas 1.2之前的to_csv不接受二进制文件句柄，包一层文本流，写完后解除包装以免关闭底层文件
+            text = io.TextIOWrapper(self.file, encoding='utf-8', newline='')
+            data.to_csv(text, header=False, index=False)
+            text.flush()
+            text.detach()
+            return
+        
+        table = self._pa.Table.from_pandas(data, preserve_index=False)
+        # atop时间戳精度为秒，按秒输出，与pandas写出的时间格式保持一致
+        ts_index = table.schema.get_field_index('timestamp')
+        table = table.set_column(ts_index, 'timestamp', table.column(ts_index).cast(self._pa.timestamp('s')))
+        if self._writer is None:
+            self._writer = self._pv.CSVWriter(self.file, table.schema,
+                                              write_options=self._pv.WriteOptions(include_header=False))
+        self._writer.write_table(table)
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+def _save_data(data, output_prefix, output_format='csv'):
+    """保存解析出的数据，返回输出文件路径"""
+    if output_format == 'parquet':
+        out_file = f"{output_prefix}.parquet"
+        data.to_parquet(out_file, index=False, compression='zstd')
+        return out_file
+    
+    out_file = f"{output_prefix}.csv"
+    with open(out_file, 'wb') as file:
+        writer = _CsvWriter(file)
+        writer.write(data)
+        writer.close()
+    return out_file
+
+def _plot_png(arrays, output_prefix):
+    """绘制内存使用图表（静态PNG），数据点远多于像素时先抽样"""
+    import matplotlib.pyplot as plt
+    
+    plot_arrays = _minmax_decimate(arrays)
     plt.figure(figsize=(12, 6))
-    plt.plot(data['timestamp'], data['mem_tot'], label='MEM Total (GB)')
-    plt.plot(data['timestamp'], data['mem_free'], label='MEM Free (GB)')
-    plt.plot(data['timestamp'], data['swp_tot'], label='SWAP Total (GB)')
-    plt.plot(data['timestamp'], data['swp_free'], label='SWAP Free (GB)')
+    for col, name, _ in _SERIES:
+        plt.plot(plot_arrays['timestamp'], plot_arrays[col], label=name)
     plt.title('Memory/Swap Usage Over Time')
     plt.xlabel('Time')
     plt.ylabel('Size (GB)')
@@ -123,57 +286,130 @@ def generate_report(data, output_prefix='memory_report', generate_html=False):
     plt.savefig(mem_chart_file)
     print(f"已保存内存使用图表: {mem_chart_file}")
     plt.close()
+
+def _plot_html(arrays, output_prefix):
+    """生成交互式HTML报告"""
+    import plotly.graph_objects as go
     
-    # 如果指定了generate_html，则生成交互式HTML报告
-    if generate_html:
-        fig = go.Figure()
-        
-        # 添加内存数据
-        fig.add_trace(go.Scatter(
-            x=data['timestamp'],
-            y=data['mem_tot'],
-            name='MEM Total (GB)',
-            mode='lines',
-            hovertemplate='%{x}<br>MEM Total: %{y:.2f} GB<extra></extra>'
-        ))
-        fig.add_trace(go.Scatter(
-            x=data['timestamp'],
-            y=data['mem_free'],
-            name='MEM Free (GB)',
-            mode='lines',
-            hovertemplate='%{x}<br>MEM Free: %{y:.2f} GB<extra></extra>'
-        ))
-        
-        # 添加交换空间数据
-        fig.add_trace(go.Scatter(
-            x=data['timestamp'],
-            y=data['swp_tot'],
-            name='SWAP Total (GB)',
-            mode='lines',
-            hovertemplate='%{x}<br>SWAP Total: %{y:.2f} GB<extra></extra>'
-        ))
-        fig.add_trace(go.Scatter(
-            x=data['timestamp'],
-            y=data['swp_free'],
-            name='SWAP Free (GB)',
+    # 一次性批量添加所有曲线，使用WebGL渲染的Scattergl应对大量数据点
+    fig = go.Figure()
+    fig.add_traces([
+        go.Scattergl(
+            x=arrays['timestamp'],
+            y=arrays[col],
+            name=name,
             mode='lines',
-            hovertemplate='%{x}<br>SWAP Free: %{y:.2f} GB<extra></extra>'
-        ))
-        
-        # 更新布局
-        fig.update_layout(
-            title='Memory/Swap Usage Over Time (Interactive)',
-            xaxis_title='Time',
-            yaxis_title='Size (GB)',
-            hovermode='x unified',
-            showlegend=True
+            hovertemplate=f'%{{x}}<br>{label}: %{{y:.2f}} GB<extra></extra>'
         )
-        
-        # 保存为HTML文件
-        html_file = f"{output_prefix}_memory_swap.html"
-        fig.write_html(html_file)
-        print(f"已保存交互式HTML报告: {html_file}")
+        for col, name, label in _SERIES
+    ])
+    
+    # 更新布局
+    fig.update_layout(
+        title='Memory/Swap Usage Over Time (Interactive)',
+        xaxis_title='Time',
+        yaxis_title='Size (GB)',
+        hovermode='x unified',
+        showlegend=True
+    )
+    
+    # 保存为HTML文件
+    html_file = f"{output_prefix}_memory_swap.html"
+    fig.write_html(html_file)
+    print(f"已保存交互式HTML报告: {html_file}")
+
+def generate_report(data, output_prefix='memory_report', generate_html=False, output_format='csv',
+                    generate_png=True):
+    """生成内存使用报告和图表
+
+    matplotlib和plotly启动较慢，只在需要生成对应图表时才导入
+    """
+    if data.empty:
+        print("没有找到有效数据")
+        return
+    
+    # 保存CSV或Parquet文件
+    data_file = _save_data(data, output_prefix, output_format)
+    print(f"已保存{'Parquet' if output_format == 'parquet' else 'CSV'}文件: {data_file}")
+    
+    # 一次性取出各列底层的NumPy数组，绘图时直接使用，不再反复构造Series
+    arrays = {col: data[col].to_numpy() for col in ['timestamp'] + _VALUE_COLUMNS}
+    
+    if generate_png:
+        _plot_png(arrays, output_prefix)
     
+    # 如果指定了generate_html，则生成交互式HTML报告
+    if generate_html:
+        _plot_html(arrays, output_prefix)
+
+def _read_csv_decimated(csv_file):
+    """分块读取CSV并逐块抽样，返回抽样后的列数组，不会一次性载入整个文件"""
+    pieces = {col: [] for col in ['timestamp'] + _VALUE_COLUMNS}
+    for chunk in pd.read_csv(csv_file, parse_dates=['timestamp'], chunksize=_CSV_CHUNK_ROWS):
+        arrays = _minmax_decimate({col: chunk[col].to_numpy() for col in pieces})
+        for col, arr in arrays.items():
+            pieces[col].append(arr)
+    # 各块抽样结果拼接后再整体抽样一次，极值点在两轮抽样中都会保留
+    return _minmax_decimate({col: np.concatenate(arrs) for col, arrs in pieces.items()})
+
+def generate_report_streaming(files, output_prefix='memory_report', generate_html=False,
+                              generate_png=True, max_workers=None):
+    """边解析边写出CSV，内存中只保留少量文件的解析结果，返回写出的记录数
+
+    文件按files的顺序写出，每个文件内部按时间戳排序；需要图表时再分块读回CSV并抽样绘制，
+    因此HTML报告中也只包含抽样后的数据点
+    """
+    csv_file = f"{output_prefix}.csv"
+    total_records = 0
+    parsed_files = 0
+    # 同时在解析的文件数，限制未写出的结果占用的内存
+    window = (max_workers or os.cpu_count() or 1) * 2
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor, open(csv_file, 'wb') as out:
+        writer = _CsvWriter(out)
+        file_iter = iter(files)
+        pending = deque((file_path, executor.submit(parse_atop_log, file_path))
+                        for file_path in itertools.islice(file_iter, window))
+        while pending:
+            file_path, future = pending.popleft()
+            # 取出一个结果的同时提交下一个文件，保持解析与写盘并行
+            next_path = next(file_iter, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(parse_atop_log, next_path)))
+            
+            file_data = _collect_result(file_path, future)
+            if file_data is None:
+                continue
+            file_data.sort_values('timestamp', inplace=True, kind='mergesort')
+            writer.write(file_data)
+            total_records += len(file_data)
+            parsed_files += 1
+        writer.close()
+    
+    if not total_records:
+        os.remove(csv_file)
+        return 0
+    
+    print(f"总共从 {parsed_files} 个文件中解析出 {total_records} 条记录")
+    print(f"已保存CSV文件: {csv_file}")
+    
+    if generate_png or generate_html:
+        arrays = _read_csv_decimated(csv_file)
+        if generate_png:
+            _plot_png(arrays, output_prefix)
+        if generate_html:
+            _plot_html(arrays, output_prefix)
+    return total_records
+
+def _positive_int(value):
+    """argparse参数类型：正整数"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"必须是正整数: {value}")
+    return number
 
 if __name__ == "__main__":
     # 创建命令行参数解析器
@@ -185,24 +421,47 @@ if __name__ == "__main__":
                       help='输出文件前缀 (默认: memory_report)')
     parser.add_argument('--html', action='store_true',
                       help='生成交互式HTML报告，可查看每个时间点的详细数据')
+    parser.add_argument('--no-png', action='store_true',
+                      help='不生成静态PNG图表')
+    parser.add_argument('--workers', '-w', type=_positive_int, default=None,
+                      help='解析目录时使用的并行进程数 (默认: CPU核数)')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                      help='数据文件的输出格式 (默认: csv)，parquet格式需要安装pyarrow')
+    parser.add_argument('--stream', action='store_true',
+                      help='解析目录时边解析边写出CSV，不在内存中保留全部数据；'
+                           '文件按文件名顺序写出，图表使用抽样后的数据')
     
     # 解析命令行参数
     args = parser.parse_args()
+    if args.stream and not args.dir:
+        parser.error('--stream 只能与 --dir 一起使用')
+    if args.stream and args.format != 'csv':
+        parser.error('--stream 只支持csv输出格式')
     
     try:
-        # 根据输入类型选择解析方法
-        if args.log_file:
-            print(f"解析单个日志文件: {args.log_file}")
-            data = parse_atop_log(args.log_file)
-        else:
-            print(f"解析目录中的所有日志文件: {args.dir}")
-            data = parse_atop_directory(args.dir)
-        
-        if not data.empty:
-            generate_report(data, args.output, args.html)
-            print("报告生成完成！")
+        if args.stream:
+            # 流式模式：边解析边写出CSV
+            print(f"流式解析目录中的所有日志文件: {args.dir}")
+            files = list_atop_files(args.dir)
+            if generate_report_streaming(files, args.output, args.html, not args.no_png, args.workers):
+                print("报告生成完成！")
+            else:
+                print("没有找到有效的内存数据")
         else:
-            print("没有找到有效的内存数据")
+            # 根据输入类型选择解析方法
+            if args.log_file:
+                print(f"解析单个日志文件: {args.log_file}")
+                data = parse_atop_log(args.log_file)
+            else:
+                print(f"解析目录中的所有日志文件: {args.dir}")
+                data = parse_atop_directory(args.dir, args.workers)
+            
+            if not data.empty:
+                generate_report(data, args.output, args.html, args.format,
+                                generate_png=not args.no_png)
+                print("报告生成完成！")
+            else:
+                print("没有找到有效的内存数据")
     except FileNotFoundError as e:
         print(f"错误: {str(e)}")
     except Exception as e: